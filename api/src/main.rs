@@ -1,11 +1,13 @@
 use std::collections::HashMap;
+use std::collections::hash_map::Entry;
 use std::env;
 use std::fs;
 use std::sync::{Arc, Mutex};
+use std::thread;
 use std::io::Cursor;
 
 use actix_cors::Cors;
-use actix_web::{get, post, web, App, HttpResponse, HttpServer, Responder, middleware::Logger, ResponseError};
+use actix_web::{get, post, web, App, HttpResponse, HttpServer, Responder, middleware::{Compress, Logger}, ResponseError};
 use anyhow::Result;
 use base64::{Engine as _, engine::general_purpose};
 use chrono::Utc;
@@ -13,6 +15,7 @@ use ed25519_dalek::{PublicKey, Signature};
 use log::info;
 use serde::{Deserialize, Serialize};
 use sha2::{Digest, Sha256};
+use tokio::sync::Semaphore;
 use dotenv;
 
 // ==== Models ====
@@ -60,6 +63,9 @@ pub struct VerifyRequest {
     pub payload: SentimentData,
     pub signature: String,
     pub signer: String,
+    /// Hex SHA-256 of the payload as recorded in the signed envelope
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub hash: Option<String>,
 }
 
 /// Response for the /verify endpoint
@@ -68,6 +74,18 @@ pub struct VerifyResponse {
     pub valid: bool,
 }
 
+/// Request for the /verify/batch endpoint
+#[derive(Debug, Clone, Serialize, Deserialize)]
+pub struct BatchVerifyRequest {
+    pub items: Vec<VerifyRequest>,
+}
+
+/// Response for the /verify/batch endpoint, one result per request item
+#[derive(Debug, Clone, Serialize, Deserialize)]
+pub struct BatchVerifyResponse {
+    pub results: Vec<bool>,
+}
+
 /// Response for the /history endpoint
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct HistoryResponse {
@@ -138,18 +156,8 @@ impl SentimentService {
 
     /// Get the latest sentiment for the specified asset
     pub async fn get_latest_sentiment(&self, asset: &str) -> Result<LatestSentimentResponse, ApiError> {
-        // Check cache first
-        if let Some(data) = self.cache.lock().unwrap().get(asset) {
-            return self.transform_to_response(asset, data.clone());
-        }
-
-        // If not in cache, try to load from file
-        match self.load_from_file(asset) {
-            Ok(data) => {
-                // Cache the result
-                self.cache.lock().unwrap().insert(asset.to_string(), data.clone());
-                self.transform_to_response(asset, data)
-            }
+        match self.get_or_load(asset) {
+            Ok(data) => self.transform_to_response(asset, data),
             Err(_) => {
                 Err(ApiError::NotFound(format!("No sentiment data found for {}", asset)))
             }
@@ -161,10 +169,10 @@ impl SentimentService {
         // In a real implementation, we would query historical data from Solana
         // For now, we'll just return the latest data as a single entry
         
-        match self.load_from_file(asset) {
+        match self.get_or_load(asset) {
             Ok(data) => {
                 let date_str = data.data.date
-                    .unwrap_or_else(|| Utc::now().format("%Y-%m-%d").to_string());
+                    .unwrap_or_else(|| Utc::now().date_naive().to_string());
                 
                 let entry = HistorySentimentEntry {
                     date: date_str,
@@ -187,7 +195,7 @@ impl SentimentService {
     fn transform_to_response(&self, asset: &str, data: SignedSentimentData) -> Result<LatestSentimentResponse, ApiError> {
         // Format the date string
         let date_str = data.data.date
-            .unwrap_or_else(|| Utc::now().format("%Y-%m-%d").to_string());
+            .unwrap_or_else(|| Utc::now().date_naive().to_string());
         
         Ok(LatestSentimentResponse {
             asset: asset.to_string(),
@@ -199,6 +207,19 @@ impl SentimentService {
         })
     }
 
+    /// Get sentiment data from the cache, loading it from file on first use
+    fn get_or_load(&self, asset: &str) -> Result<SignedSentimentData, anyhow::Error> {
+        // Check cache first
+        if let Some(data) = self.cache.lock().unwrap().get(asset) {
+            return Ok(data.clone());
+        }
+
+        // If not in cache, load from file and cache the result
+        let data = self.load_from_file(asset)?;
+        self.cache.lock().unwrap().insert(asset.to_string(), data.clone());
+        Ok(data)
+    }
+
     /// Load sentiment data from file
     fn load_from_file(&self, asset: &str) -> Result<SignedSentimentData, anyhow::Error> {
         // For demo purposes, we'll just use the signed_sentiment.json file
@@ -212,10 +233,10 @@ impl SentimentService {
         };
         
         info!("Loading sentiment data from file: {}", file_path);
-        let file_content = fs::read_to_string(&file_path)?;
+        let file_content = fs::read(&file_path)?;
         
         // Parse the JSON file
-        let signed_data: serde_json::Value = serde_json::from_str(&file_content)?;
+        let signed_data: serde_json::Value = serde_json::from_slice(&file_content)?;
         
         // Create a SentimentData object from the parsed JSON
         let sentiment_data = SentimentData {
@@ -241,19 +262,44 @@ impl SentimentService {
     }
 }
 
+/// Fewest signatures worth handing to a separate verification thread
+const MIN_VERIFY_SPAN: usize = 32;
+
+/// Number of signature verification spans allowed to run at once
+fn verify_workers() -> usize {
+    thread::available_parallelism().map_or(1, |n| n.get())
+}
+
+/// Number of decoded public keys kept by the verification service
+const PUBLIC_KEY_CACHE_SIZE: usize = 256;
+
 /// Service for verifying signatures on sentiment data
 #[derive(Clone)]
-pub struct VerificationService;
+pub struct VerificationService {
+    // Decoded public keys by their raw bytes, since the oracle signs
+    // everything with one long-lived keypair
+    public_keys: Arc<Mutex<HashMap<Vec<u8>, PublicKey>>>,
+    // One permit per core, shared by all requests, so concurrent batches
+    // queue for the blocking pool instead of oversubscribing the CPU
+    verify_permits: Arc<Semaphore>,
+}
 
 impl VerificationService {
     /// Create a new instance of the verification service
     pub fn new() -> Self {
-        Self {}
+        Self {
+            public_keys: Arc::new(Mutex::new(HashMap::new())),
+            verify_permits: Arc::new(Semaphore::new(verify_workers())),
+        }
     }
 
     /// Verify a signature against the data and signer
     pub async fn verify(&self, request: VerifyRequest) -> Result<bool, ApiError> {
         let data_hash = self.hash_sentiment_data(&request.payload)?;
+        if !self.matches_recorded_hash(&request, &data_hash) {
+            return Ok(false);
+        }
+
         let signature_bytes = self.decode_base64(&request.signature)?;
         let public_key_bytes = self.decode_base64(&request.signer)?;
         
@@ -263,13 +309,29 @@ impl VerificationService {
             })
     }
     
+    /// Check the payload hash against the one recorded at signing time, if any
+    ///
+    /// A mismatch means the payload was altered after signing, so the
+    /// signature check can be skipped entirely.
+    fn matches_recorded_hash(&self, request: &VerifyRequest, data_hash: &[u8]) -> bool {
+        match &request.hash {
+            Some(recorded) => {
+                // Decode into a fixed buffer, which also rejects a recorded
+                // hash of the wrong length
+                let mut recorded_hash = [0u8; 32];
+                hex::decode_to_slice(recorded, &mut recorded_hash).is_ok() && recorded_hash[..] == *data_hash
+            }
+            None => true,
+        }
+    }
+
     /// Hash the sentiment data using SHA-256
     fn hash_sentiment_data(&self, sentiment_data: &SentimentData) -> Result<Vec<u8>, ApiError> {
-        let canonical_json = serde_json::to_string(sentiment_data)
-            .map_err(|e| ApiError::BadRequest(format!("Failed to serialize data: {}", e)))?;
-        
+        // Serialize the canonical JSON straight into the hasher rather than
+        // building the whole string first
         let mut hasher = Sha256::new();
-        hasher.update(canonical_json.as_bytes());
+        serde_json::to_writer(&mut hasher, sentiment_data)
+            .map_err(|e| ApiError::BadRequest(format!("Failed to serialize data: {}", e)))?;
         let hash = hasher.finalize();
         
         Ok(hash.to_vec())
@@ -281,14 +343,127 @@ impl VerificationService {
             .map_err(|e| ApiError::BadRequest(format!("Invalid base64 encoding: {}", e)))
     }
     
+    /// Verify many signatures at once
+    ///
+    /// Each item is judged the way `verify` judges it: identical submissions
+    /// are checked once, payloads that do not match their recorded hash are
+    /// rejected without a signature check, and the rest are verified with
+    /// `verify_strict`, spread over the available cores. An item whose
+    /// signature or signer cannot be decoded, which `verify` answers with an
+    /// error, is reported as `false` so the other results are still returned.
+    pub async fn verify_batch(&self, requests: Vec<VerifyRequest>) -> Result<Vec<bool>, ApiError> {
+        if requests.is_empty() {
+            return Ok(Vec::new());
+        }
+
+        // Identical submissions (same payload, signature and signer) are only
+        // verified once; `slots` maps each request to its unique entry, or to
+        // None when its payload does not match the recorded hash or its
+        // signature or signer is malformed
+        let mut seen = HashMap::with_capacity(requests.len());
+        let mut slots = Vec::with_capacity(requests.len());
+        let mut unique = Vec::with_capacity(requests.len());
+
+        for request in &requests {
+            let data_hash = self.hash_sentiment_data(&request.payload)?;
+            if !self.matches_recorded_hash(request, &data_hash) {
+                slots.push(None);
+                continue;
+            }
+
+            let slot = match seen.entry((data_hash, &request.signature, &request.signer)) {
+                Entry::Occupied(entry) => *entry.get(),
+                Entry::Vacant(entry) => {
+                    let slot = self.parse_signed_item(request).ok().map(|(signature, public_key)| {
+                        unique.push((entry.key().0.clone(), signature, public_key));
+                        unique.len() - 1
+                    });
+                    *entry.insert(slot)
+                }
+            };
+            slots.push(slot);
+        }
+
+        let unique_results = self.verify_in_parallel(unique).await?;
+
+        Ok(slots.into_iter().map(|slot| slot.map_or(false, |slot| unique_results[slot])).collect())
+    }
+
+    /// Split verification into contiguous spans run on the blocking thread
+    /// pool, keeping the CPU work off the async workers
+    async fn verify_in_parallel(&self, items: Vec<(Vec<u8>, Signature, PublicKey)>) -> Result<Vec<bool>, ApiError> {
+        let span = ((items.len() + verify_workers() - 1) / verify_workers()).max(MIN_VERIFY_SPAN);
+        let items = Arc::new(items);
+
+        let mut spans = Vec::with_capacity((items.len() + span - 1) / span);
+        for start in (0..items.len()).step_by(span) {
+            let permit = Arc::clone(&self.verify_permits)
+                .acquire_owned()
+                .await
+                .expect("Verification semaphore is never closed");
+            let items = Arc::clone(&items);
+            let end = (start + span).min(items.len());
+
+            spans.push(web::block(move || {
+                let _permit = permit;
+                Self::verify_all(&items[start..end])
+            }));
+        }
+
+        let mut results = Vec::with_capacity(items.len());
+        for span in spans {
+            results.extend(span.await.map_err(|e| {
+                ApiError::InternalServerError(format!("Signature verification failed to run: {}", e))
+            })?);
+        }
+        Ok(results)
+    }
+
+    /// Verify each (hash, signature, public key) item the way `verify` does
+    fn verify_all(items: &[(Vec<u8>, Signature, PublicKey)]) -> Vec<bool> {
+        items.iter()
+            .map(|(data_hash, signature, public_key)| public_key.verify_strict(data_hash, signature).is_ok())
+            .collect()
+    }
+
+    /// Decode and parse the signature and signer of a request
+    fn parse_signed_item(&self, request: &VerifyRequest) -> Result<(Signature, PublicKey), ApiError> {
+        let signature = self.parse_signature(&self.decode_base64(&request.signature)?)?;
+        let public_key = self.parse_public_key(&self.decode_base64(&request.signer)?)?;
+        Ok((signature, public_key))
+    }
+
+    /// Parse an ED25519 signature from raw bytes
+    fn parse_signature(&self, signature_bytes: &[u8]) -> Result<Signature, ApiError> {
+        Signature::from_bytes(signature_bytes)
+            .map_err(|e| ApiError::BadRequest(format!("Invalid signature format: {}", e)))
+    }
+
+    /// Parse an ED25519 public key from raw bytes
+    fn parse_public_key(&self, public_key_bytes: &[u8]) -> Result<PublicKey, ApiError> {
+        // Decompressing the curve point is the costly part, so reuse keys
+        // we have already decoded
+        if let Some(public_key) = self.public_keys.lock().unwrap().get(public_key_bytes) {
+            return Ok(*public_key);
+        }
+
+        let public_key = PublicKey::from_bytes(public_key_bytes)
+            .map_err(|e| ApiError::BadRequest(format!("Invalid public key format: {}", e)))?;
+
+        let mut public_keys = self.public_keys.lock().unwrap();
+        if public_keys.len() >= PUBLIC_KEY_CACHE_SIZE {
+            public_keys.clear();
+        }
+        public_keys.insert(public_key_bytes.to_vec(), public_key);
+
+        Ok(public_key)
+    }
+    
     /// Verify the signature using ED25519
     fn verify_signature(&self, data_hash: &[u8], signature_bytes: &[u8], public_key_bytes: &[u8]) -> Result<bool, ApiError> {
         // Convert bytes to ED25519 types
-        let signature = Signature::from_bytes(signature_bytes)
-            .map_err(|e| ApiError::BadRequest(format!("Invalid signature format: {}", e)))?;
-        
-        let public_key = PublicKey::from_bytes(public_key_bytes)
-            .map_err(|e| ApiError::BadRequest(format!("Invalid public key format: {}", e)))?;
+        let signature = self.parse_signature(signature_bytes)?;
+        let public_key = self.parse_public_key(public_key_bytes)?;
         
         // Verify the signature
         match public_key.verify_strict(data_hash, &signature) {
@@ -346,6 +521,22 @@ async fn verify_signature(
     }
 }
 
+/// Verify signatures on several sentiment payloads at once
+#[post("/verify/batch")]
+async fn verify_signature_batch(
+    req: web::Json<BatchVerifyRequest>,
+    verification_service: web::Data<VerificationService>,
+) -> impl Responder {
+    info!("POST /verify/batch - items: {}", req.items.len());
+    
+    match verification_service.verify_batch(req.into_inner().items).await {
+        Ok(results) => {
+            HttpResponse::Ok().json(BatchVerifyResponse { results })
+        },
+        Err(e) => e.error_response(),
+    }
+}
+
 /// Serve a simple HTML dashboard
 #[get("/dashboard")]
 async fn dashboard() -> impl Responder {
@@ -588,12 +779,34 @@ async fn dashboard() -> impl Responder {
 
 // ==== Main ====
 
+/// Name the SHA-256 implementation `sha2` dispatches to on this CPU.
+///
+/// `sha2` selects its compression function at runtime, so this only mirrors
+/// the same feature checks to make the chosen backend visible in the logs.
+/// Without its `asm` feature, SHA-NI on x86 is the only hardware path.
+fn sha256_backend() -> &'static str {
+    #[cfg(any(target_arch = "x86", target_arch = "x86_64"))]
+    {
+        if is_x86_feature_detected!("sha")
+            && is_x86_feature_detected!("sse2")
+            && is_x86_feature_detected!("ssse3")
+            && is_x86_feature_detected!("sse4.1")
+        {
+            return "SHA-NI";
+        }
+    }
+
+    "software"
+}
+
 #[actix_web::main]
 async fn main() -> std::io::Result<()> {
     // Initialize environment
     dotenv::dotenv().ok();
     env_logger::init_from_env(env_logger::Env::default().default_filter_or("info"));
     
+    info!("SHA-256 backend: {}", sha256_backend());
+
     // Configure data directory - default to "../oracle-publisher" if not specified
     let data_dir = env::var("DATA_DIR").unwrap_or_else(|_| "../oracle-publisher".to_string());
     info!("Using data directory: {}", data_dir);
@@ -614,7 +827,9 @@ async fn main() -> std::io::Result<()> {
             .allow_any_header()
             .max_age(3600);
         
+        // Responses are gzip/brotli/zstd encoded per the client's Accept-Encoding
         App::new()
+            .wrap(Compress::default())
             .wrap(Logger::default())
             .wrap(cors)
             .app_data(web::Data::new(sentiment_service.clone()))
@@ -622,9 +837,188 @@ async fn main() -> std::io::Result<()> {
             .service(get_latest_sentiment)
             .service(get_sentiment_history)
             .service(verify_signature)
+            .service(verify_signature_batch)
             .service(dashboard)
     })
     .bind(bind_address)?
     .run()
     .await
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use ed25519_dalek::{Keypair, SecretKey, Signer};
+
+    /// Write `contents` as the signed sentiment file in a fresh data directory
+    fn data_dir_with(name: &str, contents: &str) -> String {
+        let dir = env::temp_dir().join(format!("sentiment-api-{}-{}", name, std::process::id()));
+        fs::create_dir_all(&dir).unwrap();
+        fs::write(dir.join("signed_sentiment.json"), contents).unwrap();
+        dir.to_string_lossy().into_owned()
+    }
+
+    #[test]
+    fn test_load_cli_signed_envelope() {
+        // The publisher CLI writes signature and signer as byte arrays
+        let data_dir = data_dir_with("cli-envelope", r#"{
+            "data": {"overall_sentiment": "BULLISH", "confidence": 0.82, "date": "2025-05-20"},
+            "signature": [1, 2, 3],
+            "signer": [4, 5, 6],
+            "hash": "00ff"
+        }"#);
+        let service = SentimentService::new(&data_dir);
+
+        let loaded = service.load_from_file("$SOL").unwrap();
+
+        assert_eq!(loaded.data.label, "BULLISH");
+        assert_eq!(loaded.data.score, 0.82);
+        assert_eq!(loaded.data.date.as_deref(), Some("2025-05-20"));
+        assert_eq!(loaded.signature, "");
+        assert_eq!(loaded.public_key, "");
+    }
+
+    fn keypair() -> Keypair {
+        let secret = SecretKey::from_bytes(&[7u8; 32]).unwrap();
+        let public = PublicKey::from(&secret);
+        Keypair { secret, public }
+    }
+
+    fn sentiment(label: &str) -> SentimentData {
+        SentimentData {
+            id: format!("sample_{}", label),
+            text: "Sample sentiment data for $SOL".to_string(),
+            label: label.to_string(),
+            score: 0.75,
+            date: Some("2025-05-15".to_string()),
+            username: "oracle".to_string(),
+            source: "Sentiment Oracle".to_string(),
+            signature: None,
+            public_key: None,
+        }
+    }
+
+    /// Build a /verify request for `payload` signed by `keypair`
+    fn signed_request(service: &VerificationService, keypair: &Keypair, payload: SentimentData) -> VerifyRequest {
+        let data_hash = service.hash_sentiment_data(&payload).unwrap();
+        let signature = keypair.sign(&data_hash);
+
+        VerifyRequest {
+            payload,
+            signature: general_purpose::STANDARD.encode(signature.to_bytes()),
+            signer: general_purpose::STANDARD.encode(keypair.public.to_bytes()),
+            hash: Some(hex::encode(&data_hash)),
+        }
+    }
+
+    #[actix_web::test]
+    async fn test_verify_batch_all_valid() {
+        let service = VerificationService::new();
+        let keypair = keypair();
+        let requests: Vec<_> = ["BULLISH", "BEARISH", "NEUTRAL"].iter()
+            .map(|label| signed_request(&service, &keypair, sentiment(label)))
+            .collect();
+
+        let results = service.verify_batch(requests.clone()).await.unwrap();
+
+        assert_eq!(results, vec![true; 3]);
+        for request in requests {
+            assert!(service.verify(request).await.unwrap());
+        }
+    }
+
+    #[actix_web::test]
+    async fn test_verify_batch_one_invalid_item() {
+        let service = VerificationService::new();
+        let keypair = keypair();
+        // Enough items to be split across verification threads
+        let mut requests: Vec<_> = (0..4 * MIN_VERIFY_SPAN)
+            .map(|i| signed_request(&service, &keypair, sentiment(&format!("LABEL_{}", i))))
+            .collect();
+        let invalid = 2 * MIN_VERIFY_SPAN + 5;
+        requests[invalid].signature = requests[0].signature.clone();
+
+        let results = service.verify_batch(requests.clone()).await.unwrap();
+
+        for (i, valid) in results.iter().enumerate() {
+            assert_eq!(*valid, i != invalid, "item {}", i);
+        }
+        assert!(!service.verify(requests[invalid].clone()).await.unwrap());
+    }
+
+    #[actix_web::test]
+    async fn test_verify_batch_duplicate_items() {
+        let service = VerificationService::new();
+        let keypair = keypair();
+        let valid = signed_request(&service, &keypair, sentiment("BULLISH"));
+        let mut invalid = signed_request(&service, &keypair, sentiment("BEARISH"));
+        invalid.signature = valid.signature.clone();
+
+        let results = service.verify_batch(vec![
+            valid.clone(), invalid.clone(), valid.clone(), invalid, valid,
+        ]).await.unwrap();
+
+        assert_eq!(results, vec![true, false, true, false, true]);
+    }
+
+    #[actix_web::test]
+    async fn test_verify_batch_malformed_items() {
+        let service = VerificationService::new();
+        let keypair = keypair();
+        let valid = signed_request(&service, &keypair, sentiment("BULLISH"));
+        let mut bad_base64 = signed_request(&service, &keypair, sentiment("BEARISH"));
+        bad_base64.signature = "not base64!".to_string();
+        let mut short_signature = signed_request(&service, &keypair, sentiment("NEUTRAL"));
+        short_signature.signature = general_purpose::STANDARD.encode([1u8; 10]);
+        let mut short_signer = valid.clone();
+        short_signer.signer = general_purpose::STANDARD.encode([1u8; 10]);
+
+        let results = service.verify_batch(vec![
+            valid.clone(), bad_base64.clone(), short_signature, short_signer, valid,
+        ]).await.unwrap();
+
+        assert_eq!(results, vec![true, false, false, false, true]);
+        assert!(service.verify(bad_base64).await.is_err());
+    }
+
+    #[actix_web::test]
+    async fn test_verify_batch_hash_mismatch() {
+        let service = VerificationService::new();
+        let keypair = keypair();
+        let valid = signed_request(&service, &keypair, sentiment("BULLISH"));
+        let mut tampered = valid.clone();
+        tampered.hash = Some(hex::encode([0u8; 32]));
+        let mut truncated = valid.clone();
+        truncated.hash = valid.hash.as_ref().map(|hash| hash[..32].to_string());
+        let mut unhashed = valid.clone();
+        unhashed.hash = None;
+
+        let results = service.verify_batch(vec![valid, tampered.clone(), truncated, unhashed]).await.unwrap();
+
+        assert_eq!(results, vec![true, false, false, true]);
+        assert!(!service.verify(tampered).await.unwrap());
+    }
+
+    #[actix_web::test]
+    async fn test_verify_batch_rejects_small_order_key() {
+        // The identity point as the key and as R, with s = 0, satisfies the
+        // verification equation but is rejected by the strict checks
+        let mut identity_signature = [0u8; 64];
+        identity_signature[0] = 1;
+        let mut identity_key = [0u8; 32];
+        identity_key[0] = 1;
+
+        let service = VerificationService::new();
+        let request = VerifyRequest {
+            payload: sentiment("BULLISH"),
+            signature: general_purpose::STANDARD.encode(identity_signature),
+            signer: general_purpose::STANDARD.encode(identity_key),
+            hash: None,
+        };
+
+        let results = service.verify_batch(vec![request.clone()]).await.unwrap();
+
+        assert_eq!(results, vec![false]);
+        assert!(!service.verify(request).await.unwrap());
+    }
+}
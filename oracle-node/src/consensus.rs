@@ -33,7 +33,6 @@ impl ConsensusEngine {
         
         // Extract prices and calculate statistics
         let prices: Vec<f64> = price_data.iter().map(|p| p.price).collect();
-        let sources: Vec<String> = price_data.iter().map(|p| p.source.clone()).collect();
         
         // Calculate basic statistics
         let mean_price = self.calculate_mean(&prices);
@@ -41,8 +40,8 @@ impl ConsensusEngine {
         let std_dev = variance.sqrt();
         
         // Detect outliers using modified Z-score
-        let outliers = self.detect_outliers(&prices, mean_price, std_dev);
-        let outlier_count = outliers.len();
+        let is_outlier = self.detect_outliers(&prices, mean_price, std_dev);
+        let outlier_count = is_outlier.iter().filter(|&&outlier| outlier).count();
         
         // Check if too many outliers
         let outlier_percentage = outlier_count as f64 / prices.len() as f64;
@@ -55,7 +54,7 @@ impl ConsensusEngine {
         }
         
         // Calculate weighted average excluding outliers
-        let consensus_price = self.calculate_weighted_average(price_data, &outliers);
+        let consensus_price = self.calculate_weighted_average(price_data, &is_outlier);
         
         // Calculate confidence based on multiple factors
         let confidence = self.calculate_confidence(price_data, variance, outlier_count);
@@ -63,7 +62,9 @@ impl ConsensusEngine {
         // Calculate consensus score
         let consensus_score = self.calculate_consensus_score(price_data, variance, outlier_count);
         
-        // Create consensus result
+        // Create consensus result; source names are only cloned once the
+        // data has passed the outlier check
+        let sources: Vec<String> = price_data.iter().map(|p| p.source.clone()).collect();
         let asset = price_data[0].asset.clone();
         let result = ConsensusResult::new(asset, consensus_price, sources)
             .with_confidence(confidence)
@@ -85,29 +86,30 @@ impl ConsensusEngine {
         sum_squared_diff / prices.len() as f64
     }
     
-    fn detect_outliers(&self, prices: &[f64], mean: f64, std_dev: f64) -> Vec<usize> {
-        let mut outliers = Vec::new();
-        
-        for (i, price) in prices.iter().enumerate() {
-            let z_score = (price - mean).abs() / std_dev;
-            // Consider outliers if Z-score > 2.5 (more conservative than 2.0)
-            if z_score > 2.5 {
-                outliers.push(i);
-            }
-        }
-        
-        outliers
+    /// Flag each price as an outlier or not, indexed like `prices`
+    fn detect_outliers(&self, prices: &[f64], mean: f64, std_dev: f64) -> Vec<bool> {
+        prices.iter()
+            .map(|price| {
+                let z_score = (price - mean).abs() / std_dev;
+                // Consider outliers if Z-score > 2.5 (more conservative than 2.0)
+                z_score > 2.5
+            })
+            .collect()
     }
     
-    fn calculate_weighted_average(&self, price_data: &[PriceData], outliers: &[usize]) -> f64 {
+    fn calculate_weighted_average(&self, price_data: &[PriceData], is_outlier: &[bool]) -> f64 {
         let mut total_weight = 0.0;
         let mut weighted_sum = 0.0;
+        let mut price_sum = 0.0;
+        let mut inlier_count = 0;
         
-        for (i, data) in price_data.iter().enumerate() {
-            if !outliers.contains(&i) {
+        for (data, &outlier) in price_data.iter().zip(is_outlier) {
+            if !outlier {
                 let weight = data.confidence;
                 weighted_sum += data.price * weight;
                 total_weight += weight;
+                price_sum += data.price;
+                inlier_count += 1;
             }
         }
         
@@ -115,11 +117,7 @@ impl ConsensusEngine {
             weighted_sum / total_weight
         } else {
             // Fallback to simple average if no weights
-            price_data.iter()
-                .enumerate()
-                .filter(|(i, _)| !outliers.contains(i))
-                .map(|(_, data)| data.price)
-                .sum::<f64>() / (price_data.len() - outliers.len()) as f64
+            price_sum / inlier_count as f64
         }
     }
     
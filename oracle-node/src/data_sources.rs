@@ -1,8 +1,10 @@
 // Data sources for fetching price data
 use anyhow::Result;
 use async_trait::async_trait;
-use reqwest::Client;
-use serde_json::Value;
+use reqwest::{header::HeaderMap, Client, Response, StatusCode};
+use serde::Deserialize;
+use std::borrow::Cow;
+use std::collections::HashMap;
 use std::time::Duration;
 
 use crate::models::PriceData;
@@ -14,6 +16,130 @@ pub trait DataSource: Send + Sync {
     fn base_url(&self) -> &str;
 }
 
+/// Build the HTTP client shared by all data sources
+///
+/// `reqwest::Client` pools connections internally and is cheap to clone, so
+/// sharing one keeps connections to each API alive across price updates.
+/// With TLS ALPN enabled, hosts that speak HTTP/2 multiplex every request
+/// over that single connection.
+pub fn build_http_client() -> Client {
+    Client::builder()
+        .timeout(Duration::from_secs(10))
+        .pool_max_idle_per_host(8)
+        .user_agent(concat!("price-oracle-node/", env!("CARGO_PKG_VERSION")))
+        .build()
+        .expect("Failed to create HTTP client")
+}
+
+/// Attempts made for a single request before a source is given up on
+const MAX_ATTEMPTS: u32 = 3;
+
+/// Delay before the first retry, doubled on each further attempt
+const RETRY_BASE_DELAY: Duration = Duration::from_millis(500);
+
+/// Longest wait before a retry; a server asking for more (e.g. a Binance
+/// rate-limit ban) is treated as unavailable for this round
+const MAX_RETRY_DELAY: Duration = Duration::from_secs(5);
+
+/// Whether a response status is worth retrying rather than failing over
+fn is_transient(status: StatusCode) -> bool {
+    status == StatusCode::TOO_MANY_REQUESTS || status.is_server_error()
+}
+
+/// Seconds requested by a `Retry-After` header, if present and numeric
+fn retry_after(headers: &HeaderMap) -> Option<Duration> {
+    headers
+        .get(reqwest::header::RETRY_AFTER)?
+        .to_str().ok()?
+        .parse::<u64>().ok()
+        .map(Duration::from_secs)
+}
+
+/// How long to wait before retrying a response, or None to give up on it
+fn retry_delay(status: StatusCode, headers: &HeaderMap, backoff: Duration) -> Option<Duration> {
+    if !is_transient(status) {
+        return None;
+    }
+    
+    match retry_after(headers) {
+        Some(wait) if wait > MAX_RETRY_DELAY => None,
+        Some(wait) => Some(wait),
+        None => Some(backoff),
+    }
+}
+
+/// GET `url`, retrying rate limits, server errors and failed connections with
+/// exponential backoff so a brief blip doesn't drop the source for this round
+///
+/// Timeouts are not retried: the client timeout already bounds how long an
+/// unresponsive host can hold up an update round.
+async fn get_with_retry(client: &Client, url: &str) -> reqwest::Result<Response> {
+    let mut delay = RETRY_BASE_DELAY;
+    let mut attempt = 1;
+    
+    loop {
+        let wait = match client.get(url).send().await {
+            Ok(response) if attempt < MAX_ATTEMPTS => {
+                match retry_delay(response.status(), response.headers(), delay) {
+                    Some(wait) => wait,
+                    None => return Ok(response),
+                }
+            }
+            Err(e) if attempt < MAX_ATTEMPTS && e.is_connect() && !e.is_timeout() => delay,
+            result => return result,
+        };
+        
+        log::debug!("Retrying {} in {:?} (attempt {}/{})", url, wait, attempt + 1, MAX_ATTEMPTS);
+        tokio::time::sleep(wait).await;
+        delay *= 2;
+        attempt += 1;
+    }
+}
+
+/// Create the default set of data sources on one shared HTTP client
+pub fn default_sources() -> Vec<Box<dyn DataSource>> {
+    let client = build_http_client();
+    
+    vec![
+        Box::new(CoinGeckoSource::new(client.clone())),
+        Box::new(CoinMarketCapSource::new(client.clone())),
+        Box::new(BinanceSource::new(client)),
+    ]
+}
+
+/// Quote for a single coin in a CoinGecko `simple/price` response
+#[derive(Debug, Deserialize)]
+struct CoinGeckoQuote {
+    usd: Option<f64>,
+    usd_24h_vol: Option<f64>,
+    usd_market_cap: Option<f64>,
+}
+
+/// Binance `ticker/price` response
+#[derive(Debug, Deserialize)]
+struct BinanceTicker {
+    price: Option<String>,
+}
+
+/// CoinGecko coin ids for the supported asset symbols
+const COINGECKO_IDS: &[(&str, &str)] = &[
+    ("BTC", "bitcoin"),
+    ("ETH", "ethereum"),
+    ("SOL", "solana"),
+    ("ADA", "cardano"),
+    ("DOT", "polkadot"),
+    ("MATIC", "matic-network"),
+    ("AVAX", "avalanche-2"),
+    ("LINK", "chainlink"),
+    ("UNI", "uniswap"),
+    ("AAVE", "aave"),
+];
+
+/// Asset symbols known to CoinMarketCap
+const COINMARKETCAP_SYMBOLS: &[&str] = &[
+    "BTC", "ETH", "SOL", "ADA", "DOT", "MATIC", "AVAX", "LINK", "UNI", "AAVE",
+];
+
 /// CoinGecko API data source
 pub struct CoinGeckoSource {
     client: Client,
@@ -21,32 +147,18 @@ pub struct CoinGeckoSource {
 }
 
 impl CoinGeckoSource {
-    pub fn new() -> Self {
-        let client = Client::builder()
-            .timeout(Duration::from_secs(10))
-            .build()
-            .expect("Failed to create HTTP client");
-        
+    pub fn new(client: Client) -> Self {
         Self {
             client,
             base_url: "https://api.coingecko.com/api/v3".to_string(),
         }
     }
     
-    fn get_coin_id(&self, asset: &str) -> String {
-        match asset.to_uppercase().as_str() {
-            "BTC" => "bitcoin".to_string(),
-            "ETH" => "ethereum".to_string(),
-            "SOL" => "solana".to_string(),
-            "ADA" => "cardano".to_string(),
-            "DOT" => "polkadot".to_string(),
-            "MATIC" => "matic-network".to_string(),
-            "AVAX" => "avalanche-2".to_string(),
-            "LINK" => "chainlink".to_string(),
-            "UNI" => "uniswap".to_string(),
-            "AAVE" => "aave".to_string(),
-            _ => asset.to_lowercase(),
-        }
+    fn get_coin_id(&self, asset: &str) -> Cow<'static, str> {
+        COINGECKO_IDS.iter()
+            .find(|(symbol, _)| symbol.eq_ignore_ascii_case(asset))
+            .map(|&(_, coin_id)| Cow::Borrowed(coin_id))
+            .unwrap_or_else(|| Cow::Owned(asset.to_lowercase()))
     }
 }
 
@@ -57,20 +169,21 @@ impl DataSource for CoinGeckoSource {
         let url = format!("{}/simple/price?ids={}&vs_currencies=usd&include_24hr_vol=true&include_market_cap=true", 
                          self.base_url, coin_id);
         
-        let response = self.client.get(&url).send().await?;
+        let response = get_with_retry(&self.client, &url).await?;
         
         if !response.status().is_success() {
             return Err(anyhow::anyhow!("CoinGecko API error: {}", response.status()));
         }
         
-        let json: Value = response.json().await?;
+        // Decode straight into typed quotes instead of a generic JSON tree
+        let mut quotes: HashMap<String, CoinGeckoQuote> = response.json().await?;
         
-        if let Some(coin_data) = json.get(coin_id) {
-            let price = coin_data["usd"].as_f64()
+        if let Some(coin_data) = quotes.remove(coin_id.as_ref()) {
+            let price = coin_data.usd
                 .ok_or_else(|| anyhow::anyhow!("Invalid price data"))?;
             
-            let volume_24h = coin_data["usd_24h_vol"].as_f64();
-            let market_cap = coin_data["usd_market_cap"].as_f64();
+            let volume_24h = coin_data.usd_24h_vol;
+            let market_cap = coin_data.usd_market_cap;
             
             Ok(PriceData::new(asset.to_string(), price, "CoinGecko".to_string())
                 .with_confidence(0.9) // CoinGecko is highly reliable
@@ -97,32 +210,18 @@ pub struct CoinMarketCapSource {
 }
 
 impl CoinMarketCapSource {
-    pub fn new() -> Self {
-        let client = Client::builder()
-            .timeout(Duration::from_secs(10))
-            .build()
-            .expect("Failed to create HTTP client");
-        
+    pub fn new(client: Client) -> Self {
         Self {
             client,
             base_url: "https://pro-api.coinmarketcap.com/v1".to_string(),
         }
     }
     
-    fn get_symbol(&self, asset: &str) -> String {
-        match asset.to_uppercase().as_str() {
-            "BTC" => "BTC".to_string(),
-            "ETH" => "ETH".to_string(),
-            "SOL" => "SOL".to_string(),
-            "ADA" => "ADA".to_string(),
-            "DOT" => "DOT".to_string(),
-            "MATIC" => "MATIC".to_string(),
-            "AVAX" => "AVAX".to_string(),
-            "LINK" => "LINK".to_string(),
-            "UNI" => "UNI".to_string(),
-            "AAVE" => "AAVE".to_string(),
-            _ => asset.to_string(),
-        }
+    fn get_symbol<'a>(&self, asset: &'a str) -> &'a str {
+        COINMARKETCAP_SYMBOLS.iter()
+            .copied()
+            .find(|symbol| symbol.eq_ignore_ascii_case(asset))
+            .unwrap_or(asset)
     }
 }
 
@@ -134,7 +233,7 @@ impl DataSource for CoinMarketCapSource {
         let symbol = self.get_symbol(asset);
         
         // Simulate CoinMarketCap response (in production, you'd use real API)
-        let simulated_price = match symbol.as_str() {
+        let simulated_price = match symbol {
             "BTC" => 45230.50,
             "ETH" => 2650.75,
             "SOL" => 98.45,
@@ -174,12 +273,7 @@ pub struct BinanceSource {
 }
 
 impl BinanceSource {
-    pub fn new() -> Self {
-        let client = Client::builder()
-            .timeout(Duration::from_secs(10))
-            .build()
-            .expect("Failed to create HTTP client");
-        
+    pub fn new(client: Client) -> Self {
         Self {
             client,
             base_url: "https://api.binance.com/api/v3".to_string(),
@@ -187,7 +281,12 @@ impl BinanceSource {
     }
     
     fn get_symbol(&self, asset: &str) -> String {
-        format!("{}USDT", asset.to_uppercase())
+        // Uppercase straight into the final buffer rather than formatting
+        // over a temporary uppercased copy
+        let mut symbol = String::with_capacity(asset.len() + "USDT".len());
+        symbol.extend(asset.chars().map(|c| c.to_ascii_uppercase()));
+        symbol.push_str("USDT");
+        symbol
     }
 }
 
@@ -197,15 +296,15 @@ impl DataSource for BinanceSource {
         let symbol = self.get_symbol(asset);
         let url = format!("{}/ticker/price?symbol={}", self.base_url, symbol);
         
-        let response = self.client.get(&url).send().await?;
+        let response = get_with_retry(&self.client, &url).await?;
         
         if !response.status().is_success() {
             return Err(anyhow::anyhow!("Binance API error: {}", response.status()));
         }
         
-        let json: Value = response.json().await?;
+        let ticker: BinanceTicker = response.json().await?;
         
-        let price_str = json["price"].as_str()
+        let price_str = ticker.price
             .ok_or_else(|| anyhow::anyhow!("Invalid price data"))?;
         
         let price = price_str.parse::<f64>()?;
@@ -224,3 +323,52 @@ impl DataSource for BinanceSource {
         &self.base_url
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use reqwest::header::{HeaderValue, RETRY_AFTER};
+
+    fn retry_after_headers(value: &str) -> HeaderMap {
+        let mut headers = HeaderMap::new();
+        headers.insert(RETRY_AFTER, HeaderValue::from_str(value).unwrap());
+        headers
+    }
+
+    #[test]
+    fn test_is_transient() {
+        assert!(is_transient(StatusCode::TOO_MANY_REQUESTS));
+        assert!(is_transient(StatusCode::INTERNAL_SERVER_ERROR));
+        assert!(is_transient(StatusCode::SERVICE_UNAVAILABLE));
+        
+        assert!(!is_transient(StatusCode::OK));
+        assert!(!is_transient(StatusCode::NOT_FOUND));
+        assert!(!is_transient(StatusCode::IM_A_TEAPOT)); // Binance IP ban
+    }
+
+    #[test]
+    fn test_retry_after() {
+        assert_eq!(retry_after(&retry_after_headers("3")), Some(Duration::from_secs(3)));
+        assert_eq!(retry_after(&retry_after_headers("Wed, 21 Oct 2015 07:28:00 GMT")), None);
+        assert_eq!(retry_after(&HeaderMap::new()), None);
+    }
+
+    #[test]
+    fn test_retry_delay() {
+        let backoff = Duration::from_millis(500);
+        
+        // Backoff applies when the server gives no usable Retry-After
+        assert_eq!(retry_delay(StatusCode::BAD_GATEWAY, &HeaderMap::new(), backoff), Some(backoff));
+        assert_eq!(
+            retry_delay(StatusCode::TOO_MANY_REQUESTS, &retry_after_headers("2"), backoff),
+            Some(Duration::from_secs(2))
+        );
+        
+        // Waits past the cap give up on the source for this round
+        let too_long = (MAX_RETRY_DELAY + Duration::from_secs(1)).as_secs().to_string();
+        assert_eq!(retry_delay(StatusCode::TOO_MANY_REQUESTS, &retry_after_headers(&too_long), backoff), None);
+        
+        // Non-transient responses are never retried
+        assert_eq!(retry_delay(StatusCode::BAD_REQUEST, &retry_after_headers("1"), backoff), None);
+    }
+}
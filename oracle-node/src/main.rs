@@ -1,5 +1,6 @@
 // Price Oracle Node - A decentralized price aggregation oracle for Solana
 use clap::{Parser, Subcommand};
+use futures::future::join_all;
 use log::{info, error};
 use std::time::Duration;
 use tokio::time::sleep;
@@ -10,7 +11,7 @@ mod validator;
 mod solana_client;
 mod models;
 
-use data_sources::{CoinGeckoSource, CoinMarketCapSource, BinanceSource, DataSource};
+use data_sources::{default_sources, DataSource};
 use consensus::ConsensusEngine;
 use validator::PriceValidator;
 use solana_client::SolanaOracleClient;
@@ -93,15 +94,7 @@ async fn start_oracle_node(
     info!("Starting Price Oracle Node for asset: {}", asset);
     
     // Initialize data sources
-    let coin_gecko = CoinGeckoSource::new();
-    let coin_market_cap = CoinMarketCapSource::new();
-    let binance = BinanceSource::new();
-    
-    let data_sources: Vec<Box<dyn DataSource>> = vec![
-        Box::new(coin_gecko),
-        Box::new(coin_market_cap),
-        Box::new(binance),
-    ];
+    let data_sources = default_sources();
     
     // Initialize consensus engine
     let consensus_engine = ConsensusEngine::new();
@@ -137,16 +130,7 @@ async fn run_single_update(asset: String, program_id: Option<String>) -> anyhow:
     info!("Running single price update for: {}", asset);
     
     // Initialize components
-    let coin_gecko = CoinGeckoSource::new();
-    let coin_market_cap = CoinMarketCapSource::new();
-    let binance = BinanceSource::new();
-    
-    let data_sources: Vec<Box<dyn DataSource>> = vec![
-        Box::new(coin_gecko),
-        Box::new(coin_market_cap),
-        Box::new(binance),
-    ];
-    
+    let data_sources = default_sources();
     let consensus_engine = ConsensusEngine::new();
     let mut validator = PriceValidator::new();
     let solana_client = SolanaOracleClient::new("https://api.devnet.solana.com", program_id)?;
@@ -167,18 +151,15 @@ async fn run_single_update(asset: String, program_id: Option<String>) -> anyhow:
 async fn test_data_sources(asset: String) -> anyhow::Result<()> {
     info!("Testing data sources for asset: {}", asset);
     
-    let coin_gecko = CoinGeckoSource::new();
-    let coin_market_cap = CoinMarketCapSource::new();
-    let binance = BinanceSource::new();
+    let sources = default_sources();
     
-    let sources: Vec<(&str, Box<dyn DataSource>)> = vec![
-        ("CoinGecko", Box::new(coin_gecko)),
-        ("CoinMarketCap", Box::new(coin_market_cap)),
-        ("Binance", Box::new(binance)),
-    ];
+    // Query every source at once; results are still reported in source order
+    let asset = asset.as_str();
+    let fetches = sources.iter()
+        .map(|source| async move { (source.name(), source.fetch_price(asset).await) });
     
-    for (name, source) in sources {
-        match source.fetch_price(&asset).await {
+    for (name, result) in join_all(fetches).await {
+        match result {
             Ok(price_data) => {
                 println!("{}: ${:.2} (confidence: {:.2})", 
                          name, price_data.price, price_data.confidence);
@@ -201,17 +182,21 @@ async fn run_price_update(
 ) -> anyhow::Result<ConsensusResult> {
     info!("Fetching price data for {}", asset);
     
-    // Fetch prices from all sources
+    // Fetch prices from all sources concurrently, so an update takes as long
+    // as the slowest source rather than the sum of all of them
+    let fetches = data_sources.iter()
+        .map(|source| async move { (source.name(), source.fetch_price(asset).await) });
+    
     let mut price_data_vec = Vec::new();
     
-    for source in data_sources {
-        match source.fetch_price(asset).await {
+    for (name, result) in join_all(fetches).await {
+        match result {
             Ok(data) => {
                 info!("Fetched price from {}: ${:.2}", data.source, data.price);
                 price_data_vec.push(data);
             },
             Err(e) => {
-                error!("Failed to fetch price from {}: {}", source.name(), e);
+                error!("Failed to fetch price from {}: {}", name, e);
             }
         }
     }
@@ -27,8 +27,8 @@ impl SolanaOracleClient {
         
         if std::path::Path::new(&solana_config_path).exists() {
             // Load Solana CLI keypair
-            let keypair_data = std::fs::read_to_string(&solana_config_path)?;
-            let keypair_bytes: Vec<u8> = serde_json::from_str(&keypair_data)?;
+            let keypair_data = std::fs::read(&solana_config_path)?;
+            let keypair_bytes: Vec<u8> = serde_json::from_slice(&keypair_data)?;
             let keypair = Keypair::from_bytes(&keypair_bytes)?;
             println!("🔑 Using Solana CLI keypair: {}", keypair.pubkey());
             Ok(keypair)
@@ -38,15 +38,16 @@ impl SolanaOracleClient {
             
             if std::path::Path::new(keypair_path).exists() {
                 // Load existing keypair
-                let keypair_data = std::fs::read_to_string(keypair_path)?;
-                let keypair_bytes: Vec<u8> = serde_json::from_str(&keypair_data)?;
+                let keypair_data = std::fs::read(keypair_path)?;
+                let keypair_bytes: Vec<u8> = serde_json::from_slice(&keypair_data)?;
                 Ok(Keypair::from_bytes(&keypair_bytes)?)
             } else {
                 // Generate new keypair and save it
                 let keypair = Keypair::new();
                 let keypair_bytes = keypair.to_bytes();
-                let keypair_vec: Vec<u8> = keypair_bytes.to_vec();
-                std::fs::write(keypair_path, serde_json::to_string(&keypair_vec)?)?;
+                // Serialize the slice straight to bytes (same format as the
+                // Solana CLI: a JSON array of numbers)
+                std::fs::write(keypair_path, serde_json::to_vec(&keypair_bytes[..])?)?;
                 println!("🔑 Generated new oracle keypair: {}", keypair.pubkey());
                 println!("💾 Saved to: {}", keypair_path);
                 Ok(keypair)
@@ -77,12 +78,10 @@ impl SolanaOracleClient {
     }
     
     pub async fn submit_price(&self, consensus_result: &ConsensusResult) -> Result<()> {
-        if self.program_id.is_none() {
+        let Some(program_id) = self.program_id else {
             log::info!("No program ID configured, skipping Solana submission");
             return Ok(());
-        }
-        
-        let program_id = self.program_id.unwrap();
+        };
         
         log::info!("Submitting price to Solana: {} = ${:.2}", 
                   consensus_result.asset, consensus_result.price);
@@ -111,7 +110,8 @@ impl SolanaOracleClient {
         log::info!("💰 Oracle balance: {:.6} SOL", balance);
         
         // Create or get oracle account
-        let oracle_account = self.get_oracle_account_address(&consensus_result.asset, program_id);
+        let seed = Self::account_seed(&consensus_result.asset);
+        let oracle_account = self.get_oracle_account_address(&seed, program_id)?;
         log::info!("📍 Oracle account: {}", oracle_account);
         
         // Check if account exists
@@ -126,10 +126,11 @@ impl SolanaOracleClient {
         }
         
         // Sign the price data with our oracle keypair
+        let timestamp = consensus_result.timestamp.timestamp();
         let price_data = format!("{}{}{}{}", 
             consensus_result.asset, 
             consensus_result.price, 
-            consensus_result.timestamp.timestamp(),
+            timestamp,
             consensus_result.confidence
         );
         
@@ -141,7 +142,7 @@ impl SolanaOracleClient {
             asset: consensus_result.asset.clone(),
             price: consensus_result.price,
             confidence: consensus_result.confidence,
-            timestamp: consensus_result.timestamp.timestamp(),
+            timestamp,
             sources: consensus_result.sources.clone(),
             consensus_score: consensus_result.consensus_score,
             signature: signature.as_ref().to_vec(),
@@ -181,11 +182,14 @@ impl SolanaOracleClient {
         Ok(())
     }
     
-    fn get_oracle_account_address(&self, asset: &str, program_id: Pubkey) -> Pubkey {
-        // Generate deterministic account address based on asset and oracle pubkey
+    fn get_oracle_account_address(&self, seed: &str, program_id: Pubkey) -> Result<Pubkey> {
+        // Generate deterministic account address based on asset seed and oracle pubkey
         let oracle_pubkey = self.keypair.pubkey();
-        let seed = format!("oracle_{}", asset);
-        Pubkey::create_with_seed(&oracle_pubkey, &seed, &program_id).unwrap()
+        Ok(Pubkey::create_with_seed(&oracle_pubkey, seed, &program_id)?)
+    }
+    
+    fn account_seed(asset: &str) -> String {
+        format!("oracle_{}", asset)
     }
     
     pub fn get_oracle_pubkey(&self) -> Pubkey {
@@ -197,11 +201,8 @@ impl SolanaOracleClient {
     }
     
     pub async fn create_oracle_account(&self, asset: &str) -> Result<Pubkey> {
-        if self.program_id.is_none() {
-            return Err(anyhow::anyhow!("No program ID configured"));
-        }
-        
-        let program_id = self.program_id.unwrap();
+        let program_id = self.program_id
+            .ok_or_else(|| anyhow::anyhow!("No program ID configured"))?;
         
         // Calculate required account size
         let sources = vec!["CoinGecko".to_string(), "CoinMarketCap".to_string(), "Binance".to_string()];
@@ -210,15 +211,18 @@ impl SolanaOracleClient {
         // Get rent exemption
         let rent = self.rpc_client.get_minimum_balance_for_rent_exemption(account_size)?;
         
-        // Generate deterministic account address
-        let oracle_account = self.get_oracle_account_address(asset, program_id);
+        // Generate deterministic account address; the seed and payer are
+        // needed again below, so build them once
+        let payer = self.keypair.pubkey();
+        let seed = Self::account_seed(asset);
+        let oracle_account = self.get_oracle_account_address(&seed, program_id)?;
         
         // Create account instruction using create_with_seed
         let create_account_ix = solana_sdk::system_instruction::create_account_with_seed(
-            &self.keypair.pubkey(),
+            &payer,
             &oracle_account,
-            &self.keypair.pubkey(),
-            &format!("oracle_{}", asset),
+            &payer,
+            &seed,
             rent,
             account_size as u64,
             &program_id,
@@ -235,7 +239,7 @@ impl SolanaOracleClient {
         let recent_blockhash = self.rpc_client.get_latest_blockhash()?;
         let transaction = Transaction::new_signed_with_payer(
             &[create_account_ix, init_ix],
-            Some(&self.keypair.pubkey()),
+            Some(&payer),
             &[&self.keypair],
             recent_blockhash,
         );
@@ -1,12 +1,12 @@
 // Price validation and quality assessment
 use anyhow::Result;
-use std::collections::HashMap;
+use std::collections::{HashMap, VecDeque};
 
 use crate::models::{PriceData, ValidationResult};
 
 pub struct PriceValidator {
-    // Historical price data for validation
-    price_history: HashMap<String, Vec<f64>>,
+    // Historical price data for validation, oldest first
+    price_history: HashMap<String, VecDeque<f64>>,
     max_history_size: usize,
 }
 
@@ -105,17 +105,15 @@ impl PriceValidator {
         })
     }
     
-    fn validate_against_history(&self, price_data: &PriceData, history: &[f64]) -> Option<ValidationResult> {
+    fn validate_against_history(&self, price_data: &PriceData, history: &VecDeque<f64>) -> Option<ValidationResult> {
         if history.len() < 3 {
             return None; // Not enough history
         }
         
         // Calculate historical statistics
-        let mean = history.iter().sum::<f64>() / history.len() as f64;
-        let variance = history.iter()
-            .map(|x| (x - mean).powi(2))
-            .sum::<f64>() / history.len() as f64;
-        let std_dev = variance.sqrt();
+        let stats = summarize(history);
+        let mean = stats.mean;
+        let std_dev = stats.std_dev;
         
         // Check for extreme price movements (> 3 standard deviations)
         let price_diff = (price_data.price - mean).abs();
@@ -145,40 +143,52 @@ impl PriceValidator {
     }
     
     fn update_price_history(&mut self, price_data: &PriceData) {
-        let history = self.price_history.entry(price_data.asset.clone()).or_insert_with(Vec::new);
+        let history = self.price_history.entry(price_data.asset.clone()).or_insert_with(VecDeque::new);
         
-        history.push(price_data.price);
+        history.push_back(price_data.price);
         
-        // Keep only recent history
+        // Keep only recent history; popping from the front of a ring buffer
+        // avoids shifting every remaining entry
         if history.len() > self.max_history_size {
-            history.remove(0);
+            history.pop_front();
         }
     }
     
     pub fn get_price_statistics(&self, asset: &str) -> Option<PriceStatistics> {
-        self.price_history.get(asset).map(|history| {
-            if history.is_empty() {
-                return PriceStatistics::default();
-            }
-            
-            let mean = history.iter().sum::<f64>() / history.len() as f64;
-            let variance = history.iter()
-                .map(|x| (x - mean).powi(2))
-                .sum::<f64>() / history.len() as f64;
-            let std_dev = variance.sqrt();
-            
-            let min = history.iter().fold(f64::INFINITY, |a, &b| a.min(b));
-            let max = history.iter().fold(f64::NEG_INFINITY, |a, &b| a.max(b));
-            
-            PriceStatistics {
-                count: history.len(),
-                mean,
-                std_dev,
-                min,
-                max,
-                variance,
-            }
-        })
+        self.price_history.get(asset).map(summarize)
+    }
+}
+
+/// Compute count, mean, variance and range of a price series in a single pass
+fn summarize(prices: &VecDeque<f64>) -> PriceStatistics {
+    if prices.is_empty() {
+        return PriceStatistics::default();
+    }
+    
+    // Welford's online algorithm keeps the variance numerically stable
+    // without a second pass over the data
+    let mut mean = 0.0;
+    let mut m2 = 0.0;
+    let mut min = f64::INFINITY;
+    let mut max = f64::NEG_INFINITY;
+    
+    for (i, &price) in prices.iter().enumerate() {
+        let delta = price - mean;
+        mean += delta / (i + 1) as f64;
+        m2 += delta * (price - mean);
+        min = min.min(price);
+        max = max.max(price);
+    }
+    
+    let variance = m2 / prices.len() as f64;
+    
+    PriceStatistics {
+        count: prices.len(),
+        mean,
+        std_dev: variance.sqrt(),
+        min,
+        max,
+        variance,
     }
 }
 
@@ -234,6 +244,42 @@ mod tests {
         assert!(result.is_err());
     }
     
+    #[test]
+    fn test_price_statistics() {
+        let mut validator = PriceValidator::new();
+        
+        for price in [100.0, 102.0, 98.0, 104.0] {
+            let price_data = vec![
+                PriceData::new("BTC".to_string(), price, "Test".to_string()),
+            ];
+            validator.validate_prices(&price_data).unwrap();
+        }
+        
+        let stats = validator.get_price_statistics("BTC").unwrap();
+        assert_eq!(stats.count, 4);
+        assert!((stats.mean - 101.0).abs() < 1e-9);
+        assert!((stats.variance - 5.0).abs() < 1e-9);
+        assert_eq!(stats.min, 98.0);
+        assert_eq!(stats.max, 104.0);
+    }
+    
+    #[test]
+    fn test_price_history_is_bounded() {
+        let mut validator = PriceValidator::new();
+        
+        for i in 0..105 {
+            let price_data = vec![
+                PriceData::new("BTC".to_string(), 100.0 + i as f64, "Test".to_string()),
+            ];
+            validator.validate_prices(&price_data).unwrap();
+        }
+        
+        let stats = validator.get_price_statistics("BTC").unwrap();
+        assert_eq!(stats.count, 100);
+        assert_eq!(stats.min, 105.0);
+        assert_eq!(stats.max, 204.0);
+    }
+    
     #[test]
     fn test_validate_zero_price() {
         let mut validator = PriceValidator::new();
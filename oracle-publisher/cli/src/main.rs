@@ -11,7 +11,7 @@ use solana_sdk::{
 };
 use solana_cli_config::Config;
 use std::fs::File;
-use std::io::Read;
+use std::io::{BufWriter, Write};
 use std::str::FromStr;
 use serde::{Serialize, Deserialize};
 use sha2::{Sha256, Digest};
@@ -40,6 +40,9 @@ struct SignedSentimentData {
     data: SentimentData,
     signature: Vec<u8>,
     signer: Vec<u8>,
+    // Hex SHA-256 of the canonical data that was signed
+    #[serde(default)]
+    hash: String,
 }
 
 // Define the CLI arguments
@@ -147,20 +150,16 @@ fn main() {
         },
         Commands::Sign { input, output } => {
             // Read the sentiment data from the input file
-            let mut file = File::open(&input).expect("Failed to open input file");
-            let mut contents = String::new();
-            file.read_to_string(&mut contents).expect("Failed to read input file");
+            let contents = std::fs::read(&input).expect("Failed to read input file");
             
-            let sentiment_data: SentimentData = serde_json::from_str(&contents)
+            let sentiment_data: SentimentData = serde_json::from_slice(&contents)
                 .expect("Failed to parse sentiment data");
             
-            // Canonicalize the JSON
-            let canonical_json = serde_json::to_string(&sentiment_data)
-                .expect("Failed to serialize sentiment data");
-            
-            // Hash the canonical JSON using SHA-256
+            // Hash the canonical JSON using SHA-256, serializing straight into
+            // the hasher instead of building the JSON string first
             let mut hasher = Sha256::new();
-            hasher.update(canonical_json.as_bytes());
+            serde_json::to_writer(&mut hasher, &sentiment_data)
+                .expect("Failed to serialize sentiment data");
             let hash = hasher.finalize();
             
             // Load ED25519 keypair for signing
@@ -175,12 +174,14 @@ fn main() {
                 data: sentiment_data,
                 signature: signature.to_bytes().to_vec(),
                 signer: dalek_keypair.public.to_bytes().to_vec(),
+                hash: hex::encode(hash),
             };
             
             // Write the signed data to the output file
-            let signed_json = serde_json::to_string_pretty(&signed_data)
+            let mut writer = BufWriter::new(File::create(&output).expect("Failed to create output file"));
+            serde_json::to_writer_pretty(&mut writer, &signed_data)
                 .expect("Failed to serialize signed data");
-            std::fs::write(&output, signed_json).expect("Failed to write signed data to file");
+            writer.flush().expect("Failed to write signed data to file");
             
             println!("Signed sentiment data and saved to {}", output);
             println!("Signature: {}", hex::encode(signature.to_bytes()));
@@ -232,11 +233,9 @@ fn main() {
                 .expect("Invalid account");
             
             // Read the signed sentiment data from the input file
-            let mut file = File::open(&input).expect("Failed to open input file");
-            let mut contents = String::new();
-            file.read_to_string(&mut contents).expect("Failed to read input file");
+            let contents = std::fs::read(&input).expect("Failed to read input file");
             
-            let signed_data: SignedSentimentData = serde_json::from_str(&contents)
+            let signed_data: SignedSentimentData = serde_json::from_slice(&contents)
                 .expect("Failed to parse signed data");
             
             // Convert the signer from bytes to a Pubkey